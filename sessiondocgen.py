@@ -24,12 +24,16 @@ import os
 import sys
 import json
 import re
+import mmap
+import stat
 import argparse
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple, Set
-from collections import defaultdict
-from dataclasses import dataclass, field, asdict
-from pathlib import Path
+from typing import IO, Callable, Dict, Iterator, List, Any, Optional, Pattern, Sequence, Tuple, Set, Union
+from collections import Counter, defaultdict
+from operator import itemgetter
+from dataclasses import dataclass, field
 import hashlib
 
 
@@ -37,7 +41,35 @@ import hashlib
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+# Records are created per tool call/error/decision, so drop the per-instance
+# __dict__ where the interpreter supports it (dataclass slots need 3.10+).
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Clip a serialized text field to limit characters (None becomes "")."""
+    return text[:limit] if text else ""
+
+
+_last_isoformat: Tuple[Optional[datetime], str] = (None, "")
+
+
+def _shared_isoformat(ts: datetime) -> str:
+    """Return ts.isoformat(), reusing the previous result for the same object.
+    
+    Parsers stamp a whole batch of file modifications, errors or decisions
+    with one datetime, so consecutive records usually share it.
+    """
+    global _last_isoformat
+    last = _last_isoformat
+    if last[0] is ts:
+        return last[1]
+    text = ts.isoformat()
+    _last_isoformat = (ts, text)
+    return text
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ToolUsage:
     """Represents a single tool call/usage."""
     tool_name: str
@@ -53,14 +85,14 @@ class ToolUsage:
             "tool_name": self.tool_name,
             "timestamp": self.timestamp.isoformat(),
             "arguments": self.arguments,
-            "result": self.result[:200] if self.result else "",  # Truncate
+            "result": _truncate(self.result, 200),
             "success": self.success,
             "duration_ms": self.duration_ms,
             "category": self.category
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FileModification:
     """Represents a file modification event."""
     file_path: str
@@ -76,16 +108,16 @@ class FileModification:
         return {
             "file_path": self.file_path,
             "modification_type": self.modification_type,
-            "timestamp": self.timestamp.isoformat(),
-            "before_snippet": self.before_snippet[:500] if self.before_snippet else "",
-            "after_snippet": self.after_snippet[:500] if self.after_snippet else "",
+            "timestamp": _shared_isoformat(self.timestamp),
+            "before_snippet": _truncate(self.before_snippet, 500),
+            "after_snippet": _truncate(self.after_snippet, 500),
             "lines_added": self.lines_added,
             "lines_removed": self.lines_removed,
             "tool_used": self.tool_used
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Decision:
     """Represents a key decision made during session."""
     decision_id: str
@@ -101,7 +133,7 @@ class Decision:
         return {
             "decision_id": self.decision_id,
             "description": self.description,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": _shared_isoformat(self.timestamp),
             "category": self.category,
             "rationale": self.rationale,
             "alternatives_considered": self.alternatives_considered,
@@ -110,7 +142,7 @@ class Decision:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ErrorSolution:
     """Represents an error and its solution."""
     error_id: str
@@ -127,8 +159,8 @@ class ErrorSolution:
         return {
             "error_id": self.error_id,
             "error_type": self.error_type,
-            "error_message": self.error_message[:500] if self.error_message else "",
-            "timestamp": self.timestamp.isoformat(),
+            "error_message": _truncate(self.error_message, 500),
+            "timestamp": _shared_isoformat(self.timestamp),
             "solution": self.solution,
             "solution_steps": self.solution_steps,
             "effective": self.effective,
@@ -137,7 +169,7 @@ class ErrorSolution:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Milestone:
     """Represents a session milestone."""
     milestone_id: str
@@ -158,7 +190,7 @@ class Milestone:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SessionMetrics:
     """Aggregated session metrics."""
     duration_minutes: float = 0.0
@@ -174,9 +206,27 @@ class SessionMetrics:
     decisions_made: int = 0
     milestones_achieved: int = 0
     unique_files_touched: int = 0
+    category_counts: Dict[str, int] = field(default_factory=dict)
+    tool_name_counts: Dict[str, int] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "duration_minutes": self.duration_minutes,
+            "total_tool_calls": self.total_tool_calls,
+            "successful_tool_calls": self.successful_tool_calls,
+            "files_created": self.files_created,
+            "files_edited": self.files_edited,
+            "files_deleted": self.files_deleted,
+            "total_lines_added": self.total_lines_added,
+            "total_lines_removed": self.total_lines_removed,
+            "errors_encountered": self.errors_encountered,
+            "errors_resolved": self.errors_resolved,
+            "decisions_made": self.decisions_made,
+            "milestones_achieved": self.milestones_achieved,
+            "unique_files_touched": self.unique_files_touched,
+            "category_counts": dict(self.category_counts),
+            "tool_name_counts": dict(self.tool_name_counts)
+        }
 
 
 # ============================================================================
@@ -213,6 +263,138 @@ TOOL_CATEGORIES = {
 }
 
 
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+# Parsers accept decoded text or a raw bytes-like buffer (e.g. an mmap'd log)
+Content = Union[str, bytes, mmap.mmap]
+
+
+def _bytes_pattern(pattern: Pattern) -> Pattern:
+    """Compile the bytes-mode twin of a str pattern for scanning raw buffers."""
+    return re.compile(pattern.pattern.encode('utf-8'), pattern.flags & ~re.UNICODE)
+
+
+# ASCII bytes the byte-mode twins would read differently from the str
+# patterns: the \x1c-\x1f separators (\s in str mode only) and \r (text
+# mode translates newlines). Non-ASCII bytes are checked separately.
+_TEXT_ONLY_BYTES = (b'\r', b'\x1c', b'\x1d', b'\x1e', b'\x1f')
+_TEXT_ONLY_CHARS = ('\x1c', '\x1d', '\x1e', '\x1f')
+_TEXT_CHECK_CHUNK = 1 << 20
+
+
+def _needs_text_scan(buffer: Content) -> bool:
+    """Check whether a buffer holds non-ASCII or text-only bytes, a chunk at a time."""
+    for start in range(0, len(buffer), _TEXT_CHECK_CHUNK):
+        chunk = buffer[start:start + _TEXT_CHECK_CHUNK]
+        if not chunk.isascii() or any(sep in chunk for sep in _TEXT_ONLY_BYTES):
+            return True
+    return False
+
+
+def _scannable(content: Content) -> Content:
+    """Return content in a form every parser pattern agrees on.
+    
+    Newlines are translated as a text-mode open() would. Buffers that
+    _needs_text_scan are decoded so the str patterns scan them; clean
+    buffers are passed through for the faster byte-mode twins.
+    """
+    if not isinstance(content, str):
+        if not _needs_text_scan(content):
+            return content
+        content = str(content, 'utf-8', 'ignore')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
+def _tool_scannable(content: Content) -> Content:
+    """Encode clean all-ASCII text from _scannable for the byte-mode tool and error patterns."""
+    if isinstance(content, str) and content.isascii() and not any(sep in content for sep in _TEXT_ONLY_CHARS):
+        return content.encode('ascii')
+    return content
+
+
+def _text(value: Union[str, bytes]) -> str:
+    """Decode a captured bytes group; str values pass through unchanged."""
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'ignore')
+    return value
+
+
+@contextmanager
+def _map_log_file(log_path: str) -> Iterator[Content]:
+    """Map a log file read-only so parsers can scan it without copying.
+    
+    Only non-empty regular files are mapped. Pipes, FIFOs and devices such
+    as /dev/stdin report a size of 0 however much they hold, so they are
+    read to the end instead; empty files yield an empty string.
+    """
+    try:
+        f = open(log_path, 'rb')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Log file not found: {log_path}") from None
+    
+    with f:
+        info = os.fstat(f.fileno())
+        if not stat.S_ISREG(info.st_mode):
+            yield _scannable(f.read())
+            return
+        if info.st_size == 0:
+            yield ""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Parsers sweep the mapping front to back; let the kernel read ahead
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield _scannable(mm)
+
+
+def _basename(path: str) -> str:
+    """Return the last component of a / or \\ separated path, for display."""
+    path = path.rstrip('/\\')
+    return path[max(path.rfind('/'), path.rfind('\\')) + 1:]
+
+
+def _ellipsize(text: str, limit: int) -> str:
+    """Clip text for display, marking it with "..." only when it was cut."""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
+
+def _compile_keyword_prefilter(category_keywords: Dict[str, List[str]]) -> Pattern:
+    """Compile every keyword of a category -> keywords map into one prefilter.
+    
+    Keywords are lowercase and matched against lowercased text. A flat,
+    case-sensitive, group-free alternation lets the regex engine skip ahead
+    on its literal-prefix fast path.
+    """
+    return re.compile("|".join(
+        re.escape(kw) for keywords in category_keywords.values() for kw in keywords
+    ))
+
+
+def _match_category(
+    prefilter: Pattern,
+    category_keywords: Dict[str, List[str]],
+    text: str
+) -> Optional[str]:
+    """Return the first category (in map order) with a keyword in text.
+    
+    Most text matches no keyword at all, so one prefilter scan settles the
+    common case; the per-category keyword sweep only runs on a hit.
+    """
+    text_lower = text.lower()
+    if not prefilter.search(text_lower):
+        return None
+    for category, keywords in category_keywords.items():
+        if any(kw in text_lower for kw in keywords):
+            return category
+    return None
+
+
 # ============================================================================
 # PARSERS
 # ============================================================================
@@ -220,27 +402,59 @@ TOOL_CATEGORIES = {
 class ToolUsageParser:
     """Parses tool usage from various log formats."""
     
-    # Pattern for common tool call formats
+    # Pattern for common tool call formats (compiled once at import)
     TOOL_CALL_PATTERNS = [
         # JSON-style: {"tool": "read_file", "args": {...}}
-        r'\{["\']tool["\']\s*:\s*["\'](\w+)["\'].*?["\']args["\']\s*:\s*(\{[^}]+\})',
+        re.compile(r'\{["\']tool["\']\s*:\s*["\'](\w+)["\'].*?["\']args["\']\s*:\s*(\{[^}]+\})', re.DOTALL),
         # XML-style: <tool name="read_file">...</tool>
-        r'<tool\s+name=["\'](\w+)["\']>(.*?)</tool>',
-        # Function-style: read_file(file="path")
-        r'(\w+)\s*\(\s*([^)]+)\)',
+        re.compile(r'<tool\s+name=["\'](\w+)["\']>(.*?)</tool>', re.DOTALL),
+        # Function-style: read_file(file="path") - known tools only, since any
+        # word( would otherwise match every function call in the log. The
+        # argument span is bounded so an unclosed "(" can't scan to the end.
+        re.compile(
+            r'\b(' + '|'.join(re.escape(name) for name in sorted(TOOL_CATEGORIES, key=len, reverse=True))
+            + r')\s*\(\s*([^)]{1,512})\)',
+            re.DOTALL
+        ),
         # antml invoke style
-        r'<invoke\s+name=["\']([^"\']+)["\']',
+        re.compile(r'<invoke\s+name=["\']([^"\']+)["\']', re.DOTALL),
     ]
     
+    # antml invoke style (tried first, most common in our system)
+    INVOKE_PATTERN = re.compile(r'<invoke\s+name=["\']([^"\']+)["\']')
+    
     ERROR_PATTERNS = [
         # Python errors
-        r'((?:Traceback|Error|Exception|Failed)[^\n]*(?:\n[^\n]+){0,10})',
+        re.compile(r'((?:Traceback|Error|Exception|Failed)[^\n]*(?:\n[^\n]+){0,10})', re.MULTILINE | re.IGNORECASE),
         # Build errors
-        r'((?:error|FAILED|ERROR):\s*[^\n]+)',
+        re.compile(r'((?:error|FAILED|ERROR):\s*[^\n]+)', re.MULTILINE | re.IGNORECASE),
         # Exit codes
-        r'Exit code:\s*([1-9]\d*)',
+        re.compile(r'Exit code:\s*([1-9]\d*)', re.MULTILINE | re.IGNORECASE),
     ]
     
+    # Union of the literals every ERROR_PATTERNS match must start with, so
+    # its hits are the only offsets an error pattern can match at. None of
+    # the literals can overlap another, so finditer sees every occurrence.
+    # Keep this in sync when adding an error pattern.
+    ERROR_TRIGGER_PATTERN = re.compile(r'traceback|error|exception|failed|exit code:', re.IGNORECASE)
+    
+    # Bytes-mode twins used when scanning raw (undecoded) buffers
+    TOOL_CALL_PATTERNS_BYTES = [_bytes_pattern(p) for p in TOOL_CALL_PATTERNS]
+    INVOKE_PATTERN_BYTES = _bytes_pattern(INVOKE_PATTERN)
+    ERROR_PATTERNS_BYTES = [_bytes_pattern(p) for p in ERROR_PATTERNS]
+    ERROR_TRIGGER_PATTERN_BYTES = _bytes_pattern(ERROR_TRIGGER_PATTERN)
+    
+    # Checked in order - the first category with a matching keyword wins
+    ERROR_CATEGORY_KEYWORDS = {
+        "dependency": ["import", "module", "package", "dependency", "pip"],
+        "syntax": ["syntax", "parse", "unexpected token", "indent"],
+        "build": ["build", "compile", "gradle", "npm run", "webpack"],
+        "network": ["network", "connection", "timeout", "socket", "http"],
+        "permission": ["permission", "access denied", "unauthorized"],
+    }
+    
+    ERROR_CATEGORY_PREFILTER = _compile_keyword_prefilter(ERROR_CATEGORY_KEYWORDS)
+    
     def __init__(self):
         self.tool_usages: List[ToolUsage] = []
         self.errors: List[ErrorSolution] = []
@@ -248,19 +462,23 @@ class ToolUsageParser:
     
     def parse_log_file(self, log_path: str) -> Tuple[List[ToolUsage], List[ErrorSolution]]:
         """Parse a log file for tool usages and errors."""
-        if not os.path.exists(log_path):
-            raise FileNotFoundError(f"Log file not found: {log_path}")
-        
-        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        return self.parse_content(content)
+        # Scan the file through a read-only mapping so it is never copied
+        # into a Python string; only matched groups get decoded.
+        with _map_log_file(log_path) as content:
+            return self._parse_scannable(content)
     
-    def parse_content(self, content: str) -> Tuple[List[ToolUsage], List[ErrorSolution]]:
-        """Parse content string for tool usages and errors."""
+    def parse_content(self, content: Content) -> Tuple[List[ToolUsage], List[ErrorSolution]]:
+        """Parse content (text or a bytes-like buffer) for tool usages and errors."""
+        return self._parse_scannable(_scannable(content))
+    
+    def _parse_scannable(self, content: Content) -> Tuple[List[ToolUsage], List[ErrorSolution]]:
+        """Parse content already normalized by _scannable."""
         self.tool_usages = []
         self.errors = []
         
+        # ASCII text decodes back identically, and the byte patterns scan it faster
+        content = _tool_scannable(content)
+        
         # Extract tool calls
         self._extract_tool_calls(content)
         
@@ -269,16 +487,18 @@ class ToolUsageParser:
         
         return self.tool_usages, self.errors
     
-    def _extract_tool_calls(self, content: str) -> None:
+    def _extract_tool_calls(self, content: Content) -> None:
         """Extract tool calls from content."""
         base_time = datetime.now()
         call_index = 0
+        binary = not isinstance(content, str)
+        append = self.tool_usages.append
+        resolve = self._tool_resolver()
         
         # Try antml invoke pattern (most common in our system)
-        invoke_pattern = r'<invoke\s+name=["\']([^"\']+)["\']'
-        for match in re.finditer(invoke_pattern, content):
-            tool_name = match.group(1)
-            category = TOOL_CATEGORIES.get(tool_name, "other")
+        invoke_pattern = self.INVOKE_PATTERN_BYTES if binary else self.INVOKE_PATTERN
+        for match in invoke_pattern.finditer(content):
+            tool_name, category = resolve(match.group(1))
             
             usage = ToolUsage(
                 tool_name=tool_name,
@@ -286,64 +506,101 @@ class ToolUsageParser:
                 category=category,
                 success=True
             )
-            self.tool_usages.append(usage)
+            append(usage)
             call_index += 1
         
-        # Try other patterns if no antml found
+        # Try other patterns if no antml found, stopping at the first format that hits
         if not self.tool_usages:
-            for pattern in self.TOOL_CALL_PATTERNS:
-                for match in re.finditer(pattern, content, re.DOTALL):
-                    tool_name = match.group(1)
+            patterns = self.TOOL_CALL_PATTERNS_BYTES if binary else self.TOOL_CALL_PATTERNS
+            for pattern in patterns:
+                if self.tool_usages:
+                    break
+                for match in pattern.finditer(content):
+                    tool_name, category = resolve(match.group(1))
                     if tool_name in TOOL_CATEGORIES or not tool_name.startswith('_'):
-                        category = TOOL_CATEGORIES.get(tool_name, "other")
                         usage = ToolUsage(
                             tool_name=tool_name,
                             timestamp=base_time + timedelta(seconds=call_index),
                             category=category,
                             success=True
                         )
-                        self.tool_usages.append(usage)
+                        append(usage)
                         call_index += 1
     
-    def _extract_errors(self, content: str) -> None:
+    @staticmethod
+    def _tool_resolver() -> Callable[[Union[str, bytes]], Tuple[str, str]]:
+        """Return a memoizing lookup from a captured tool name to (name, category).
+        
+        A log names the same few tools thousands of times, so each distinct
+        capture is decoded, interned and categorized once; every usage of a
+        tool then shares one name string instead of holding its own copy.
+        """
+        resolved: Dict[Union[str, bytes], Tuple[str, str]] = {}
+        category_of = TOOL_CATEGORIES.get
+        
+        def resolve(raw: Union[str, bytes]) -> Tuple[str, str]:
+            hit = resolved.get(raw)
+            if hit is None:
+                name = sys.intern(_text(raw))
+                hit = resolved[raw] = (name, category_of(name, "other"))
+            return hit
+        
+        return resolve
+    
+    def _extract_errors(self, content: Content) -> None:
         """Extract errors from content."""
-        for pattern in self.ERROR_PATTERNS:
-            for match in re.finditer(pattern, content, re.MULTILINE | re.IGNORECASE):
-                error_text = match.group(1) if match.lastindex else match.group(0)
+        binary = not isinstance(content, str)
+        trigger = self.ERROR_TRIGGER_PATTERN_BYTES if binary else self.ERROR_TRIGGER_PATTERN
+        
+        # One scan for the trigger literals finds every offset an error can
+        # start at; clean logs stop here.
+        starts = [m.start() for m in trigger.finditer(content)]
+        if not starts:
+            return
+        
+        patterns = self.ERROR_PATTERNS_BYTES if binary else self.ERROR_PATTERNS
+        now = datetime.now()
+        append = self.errors.append
+        categorize = self._categorize_error
+        for pattern in patterns:
+            # Anchored matches at the trigger offsets, skipping offsets inside
+            # the previous match - the same matches finditer would return
+            match_at = pattern.match
+            end = 0
+            for start in starts:
+                if start < end:
+                    continue
+                match = match_at(content, start)
+                if match is None:
+                    continue
+                end = match.end()
+                error_text = _text(match.group(1) if match.lastindex else match.group(0))
                 
                 # Categorize error
-                error_type = self._categorize_error(error_text)
+                error_type = categorize(error_text)
                 
                 self._error_counter += 1
                 error = ErrorSolution(
                     error_id=f"ERR_{self._error_counter:04d}",
                     error_type=error_type,
                     error_message=error_text.strip()[:500],
-                    timestamp=datetime.now()
+                    timestamp=now
                 )
-                self.errors.append(error)
+                append(error)
     
     def _categorize_error(self, error_text: str) -> str:
         """Categorize error type."""
-        error_lower = error_text.lower()
-        
-        if any(k in error_lower for k in ['import', 'module', 'package', 'dependency', 'pip']):
-            return "dependency"
-        elif any(k in error_lower for k in ['syntax', 'parse', 'unexpected token', 'indent']):
-            return "syntax"
-        elif any(k in error_lower for k in ['build', 'compile', 'gradle', 'npm run', 'webpack']):
-            return "build"
-        elif any(k in error_lower for k in ['network', 'connection', 'timeout', 'socket', 'http']):
-            return "network"
-        elif any(k in error_lower for k in ['permission', 'access denied', 'unauthorized']):
-            return "permission"
-        else:
-            return "runtime"
+        return _match_category(self.ERROR_CATEGORY_PREFILTER, self.ERROR_CATEGORY_KEYWORDS, error_text) or "runtime"
 
 
 class FileModificationParser:
     """Parses file modifications from logs or file system."""
     
+    DIFF_HEADER = '\ndiff --git a/'
+    
+    # Line boundaries str.splitlines() honours besides "\n"
+    LINE_BREAKS = ('\r', '\x0b', '\x0c', '\x1c', '\x1d', '\x1e', '\x85', '\u2028', '\u2029')
+    
     def __init__(self):
         self.modifications: List[FileModification] = []
     
@@ -351,12 +608,18 @@ class FileModificationParser:
         """Extract file modifications from tool usages."""
         self.modifications = []
         
+        # One stat per distinct path, however often it is written
+        exists_cache: Dict[str, bool] = {}
+        
         for usage in tool_usages:
             if usage.tool_name == "write":
                 file_path = usage.arguments.get("file_path", "unknown")
+                exists = exists_cache.get(file_path)
+                if exists is None:
+                    exists = exists_cache[file_path] = os.path.exists(file_path)
                 mod = FileModification(
                     file_path=file_path,
-                    modification_type="created" if not os.path.exists(file_path) else "edited",
+                    modification_type="created" if not exists else "edited",
                     timestamp=usage.timestamp,
                     tool_used="write"
                 )
@@ -385,55 +648,72 @@ class FileModificationParser:
         return self.modifications
     
     def parse_from_git_diff(self, diff_content: str) -> List[FileModification]:
-        """Parse file modifications from git diff output."""
+        """Parse file modifications from git diff output.
+        
+        Headers are located with str.find and the +/- lines under each one
+        are tallied with str.count, so the diff body is never split into
+        per-line strings.
+        """
         self.modifications = []
+        now = datetime.now()
+        append = self.modifications.append
         
-        # Pattern for diff headers - match "diff --git a/file b/file"
-        diff_pattern = r'^diff --git a/(.+?) b/(.+?)$'
-        add_pattern = r'^\+(?!\+\+)(.*)$'
-        remove_pattern = r'^-(?!--)(.*)$'
+        # Everything below works on "\n"-separated lines, so first rewrite any
+        # other boundary splitlines() would honour (CRLF diffs, form feeds...)
+        if any(br in diff_content for br in self.LINE_BREAKS):
+            diff_content = '\n'.join(diff_content.splitlines())
         
-        current_file = None
-        lines_added = 0
-        lines_removed = 0
+        # A leading newline lets every line, the first included, be found
+        # as "\n" + line
+        content = '\n' + diff_content
+        header = self.DIFF_HEADER
         
-        for line in diff_content.split('\n'):
-            diff_match = re.match(diff_pattern, line)
-            if diff_match:
+        current_file = None
+        body_start = 0
+        pos = content.find(header)
+        while pos != -1:
+            line_end = content.find('\n', pos + 1)
+            if line_end == -1:
+                line_end = len(content)
+            line = content[pos + 1:line_end]
+            
+            # Diff headers look like "diff --git a/file b/file"
+            if ' b/' in line:
                 # Save previous file if exists
                 if current_file:
-                    mod = FileModification(
-                        file_path=current_file,
-                        modification_type="edited",
-                        timestamp=datetime.now(),
-                        lines_added=lines_added,
-                        lines_removed=lines_removed,
-                        tool_used="git"
-                    )
-                    self.modifications.append(mod)
+                    append(self._git_modification(current_file, content, body_start, pos, now))
                 
-                current_file = diff_match.group(2)
-                lines_added = 0
-                lines_removed = 0
-            elif current_file:
-                if re.match(add_pattern, line):
-                    lines_added += 1
-                elif re.match(remove_pattern, line):
-                    lines_removed += 1
+                current_file = line.rpartition(' b/')[2]
+                body_start = line_end
+            pos = content.find(header, line_end)
         
         # Don't forget last file
         if current_file:
-            mod = FileModification(
-                file_path=current_file,
-                modification_type="edited",
-                timestamp=datetime.now(),
-                lines_added=lines_added,
-                lines_removed=lines_removed,
-                tool_used="git"
-            )
-            self.modifications.append(mod)
+            append(self._git_modification(current_file, content, body_start, len(content), now))
         
         return self.modifications
+    
+    @staticmethod
+    def _git_modification(
+        file_path: str,
+        content: str,
+        start: int,
+        end: int,
+        now: datetime
+    ) -> FileModification:
+        """Build the modification for one file's diff body, content[start:end]."""
+        count = content.count
+        # "+++"/"---" are file headers, not content lines
+        lines_added = count('\n+', start, end) - count('\n+++', start, end)
+        lines_removed = count('\n-', start, end) - count('\n---', start, end)
+        return FileModification(
+            file_path=file_path,
+            modification_type="edited",
+            timestamp=now,
+            lines_added=lines_added,
+            lines_removed=lines_removed,
+            tool_used="git"
+        )
 
 
 class DecisionParser:
@@ -442,9 +722,20 @@ class DecisionParser:
     DECISION_KEYWORDS = [
         r'\b(?:decided|decision|chose|choosing|selected|opted|went with)\b',
         r'\b(?:will use|using|implemented|implementing)\b',
-        r'\b(?:approach|strategy|solution|fix)\b.*\b(?:is|was|will be)\b',
+        r'\b(?:approach|strategy|solution|fix)\b[^.!?\n]*\b(?:is|was|will be)\b',
     ]
     
+    # All keyword patterns fused into one alternation. Keywords never span a
+    # sentence terminator, so this can run over whole content. The plain
+    # pattern matches lowercased text; the case-insensitive twins are for
+    # text that can't be lowercased in place (raw buffers, rare Unicode).
+    DECISION_PATTERN = re.compile('|'.join(f'(?:{p})' for p in DECISION_KEYWORDS))
+    DECISION_PATTERN_NOCASE = re.compile(DECISION_PATTERN.pattern, re.IGNORECASE)
+    DECISION_PATTERN_BYTES = _bytes_pattern(DECISION_PATTERN_NOCASE)
+    
+    SENTENCE_END_PATTERN = re.compile(r'[.!?\n]')
+    SENTENCE_END_PATTERN_BYTES = _bytes_pattern(SENTENCE_END_PATTERN)
+    
     CATEGORY_KEYWORDS = {
         "architecture": ["architecture", "design", "structure", "pattern", "module"],
         "bug_fix": ["fix", "bug", "error", "issue", "problem", "resolve"],
@@ -453,47 +744,135 @@ class DecisionParser:
         "config": ["config", "configuration", "setting", "environment", "variable"],
     }
     
+    CATEGORY_PREFILTER = _compile_keyword_prefilter(CATEGORY_KEYWORDS)
+    
     def __init__(self):
         self.decisions: List[Decision] = []
         self._decision_counter = 0
     
-    def parse_content(self, content: str) -> List[Decision]:
-        """Parse decisions from content."""
+    def parse_content(self, content: Content) -> List[Decision]:
+        """Parse decisions from content (text or a bytes-like buffer)."""
+        return self._parse_scannable(_scannable(content))
+    
+    def _parse_scannable(self, content: Content) -> List[Decision]:
+        """Parse decisions from content already normalized by _scannable."""
         self.decisions = []
+        now = datetime.now()
+        append = self.decisions.append
         
-        # Split into sentences/paragraphs
-        sentences = re.split(r'[.!?\n]', content)
-        
-        for sentence in sentences:
-            if self._is_decision(sentence):
-                self._decision_counter += 1
-                category = self._categorize_decision(sentence)
-                
-                decision = Decision(
-                    decision_id=f"DEC_{self._decision_counter:04d}",
-                    description=sentence.strip()[:200],
-                    timestamp=datetime.now(),
-                    category=category
-                )
-                self.decisions.append(decision)
+        for sentence in self._decision_sentences(content):
+            self._decision_counter += 1
+            category = self._categorize_decision(sentence)
+            
+            decision = Decision(
+                decision_id=f"DEC_{self._decision_counter:04d}",
+                description=sentence.strip()[:200],
+                timestamp=now,
+                category=category
+            )
+            append(decision)
         
         return self.decisions
     
-    def _is_decision(self, text: str) -> bool:
-        """Check if text contains a decision."""
-        text_lower = text.lower()
-        for pattern in self.DECISION_KEYWORDS:
-            if re.search(pattern, text_lower):
-                return True
-        return False
+    def _decision_sentences(self, content: Content) -> Iterator[str]:
+        """Yield each sentence (split on . ! ? and newlines) containing a decision.
+        
+        Rather than splitting all of content, the decision pattern is searched
+        directly and only the sentences it hits are sliced out (and decoded).
+        """
+        if isinstance(content, str):
+            if content.isascii():
+                # A same-size copy whose offsets line up, so match lowercase
+                # and slice the original
+                pattern, haystack = self.DECISION_PATTERN, content.lower()
+            else:
+                # Lowering non-ASCII text builds a far larger temporary than
+                # the text itself; let the regex fold case instead
+                pattern, haystack = self.DECISION_PATTERN_NOCASE, content
+            end_pattern, delimiters = self.SENTENCE_END_PATTERN, ('.', '!', '?', '\n')
+        else:
+            # _scannable only leaves buffers byte mode reads like text
+            pattern, haystack = self.DECISION_PATTERN_BYTES, content
+            end_pattern, delimiters = self.SENTENCE_END_PATTERN_BYTES, (b'.', b'!', b'?', b'\n')
+        
+        pos = 0
+        while True:
+            match = pattern.search(haystack, pos)
+            if match is None:
+                return
+            hit = match.start()
+            start = max(pos, max(haystack.rfind(d, pos, hit) for d in delimiters) + 1)
+            end_match = end_pattern.search(haystack, match.end())
+            end = end_match.start() if end_match else len(content)
+            yield _text(content[start:end])
+            pos = end + 1
     
     def _categorize_decision(self, text: str) -> str:
         """Categorize a decision."""
-        text_lower = text.lower()
-        for category, keywords in self.CATEGORY_KEYWORDS.items():
-            if any(kw in text_lower for kw in keywords):
-                return category
-        return "general"
+        return _match_category(self.CATEGORY_PREFILTER, self.CATEGORY_KEYWORDS, text) or "general"
+
+
+# ============================================================================
+# PARALLEL PARSING
+# ============================================================================
+
+def _available_cpus() -> int:
+    """Count the CPUs this process may run on.
+    
+    os.cpu_count() reports every CPU in the machine; the affinity mask is
+    what pinned or containerized runs actually get.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _parse_tool_calls(content: Content) -> List[ToolUsage]:
+    parser = ToolUsageParser()
+    parser._extract_tool_calls(content)
+    return parser.tool_usages
+
+
+def _parse_errors(content: Content) -> List[ErrorSolution]:
+    parser = ToolUsageParser()
+    parser._extract_errors(content)
+    return parser.errors
+
+
+def _parse_decisions(content: Content) -> List[Decision]:
+    return DecisionParser()._parse_scannable(content)
+
+
+def _parse_log_path(log_path: str) -> Tuple[List[ToolUsage], List[ErrorSolution], List[Decision]]:
+    with _map_log_file(log_path) as content:
+        tool_usages, errors = ToolUsageParser()._parse_scannable(content)
+        decisions = DecisionParser()._parse_scannable(content)
+    return tool_usages, errors, decisions
+
+
+def parse_session(
+    content: str,
+    workers: int = 1
+) -> Tuple[List[ToolUsage], List[ErrorSolution], List[Decision]]:
+    """Parse tool calls, errors and decisions, optionally in worker processes.
+    
+    The three scans are independent and CPU-bound. With workers of 2 or
+    more (capped at 3 and the available CPUs) each runs in its own worker
+    process; on spawn platforms the calling script then needs an
+    if __name__ == "__main__" guard.
+    """
+    # Normalize once here; the workers call the extract steps directly
+    content = _scannable(content)
+    tool_content = _tool_scannable(content)
+    workers = min(workers, 3, _available_cpus())
+    if workers < 2:
+        return _parse_tool_calls(tool_content), _parse_errors(tool_content), _parse_decisions(content)
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tool_calls = executor.submit(_parse_tool_calls, tool_content)
+        errors = executor.submit(_parse_errors, tool_content)
+        decisions = executor.submit(_parse_decisions, content)
+        return tool_calls.result(), errors.result(), decisions.result()
 
 
 # ============================================================================
@@ -516,30 +895,53 @@ class MetricsCalculator:
         """Calculate comprehensive session metrics."""
         metrics = SessionMetrics()
         
+        # Tool calls - success count, per-category/per-name counts and time span in a single pass
+        successful = 0
+        first = last = None
+        categories: Dict[str, int] = defaultdict(int)
+        names: Dict[str, int] = defaultdict(int)
+        for u in tool_usages:
+            if u.success:
+                successful += 1
+            categories[u.category] += 1
+            names[u.tool_name] += 1
+            ts = u.timestamp
+            if first is None or ts < first:
+                first = ts
+            if last is None or ts > last:
+                last = ts
+        metrics.total_tool_calls = len(tool_usages)
+        metrics.successful_tool_calls = successful
+        metrics.category_counts = dict(categories)
+        metrics.tool_name_counts = dict(names)
+        
         # Duration
         if start_time and end_time:
             duration = (end_time - start_time).total_seconds() / 60
             metrics.duration_minutes = round(duration, 2)
         elif tool_usages:
-            first = min(u.timestamp for u in tool_usages)
-            last = max(u.timestamp for u in tool_usages)
             metrics.duration_minutes = round((last - first).total_seconds() / 60, 2)
         
-        # Tool calls
-        metrics.total_tool_calls = len(tool_usages)
-        metrics.successful_tool_calls = sum(1 for u in tool_usages if u.success)
-        
-        # File modifications
-        metrics.files_created = sum(1 for m in file_modifications if m.modification_type == "created")
-        metrics.files_edited = sum(1 for m in file_modifications if m.modification_type == "edited")
-        metrics.files_deleted = sum(1 for m in file_modifications if m.modification_type == "deleted")
-        metrics.total_lines_added = sum(m.lines_added for m in file_modifications)
-        metrics.total_lines_removed = sum(m.lines_removed for m in file_modifications)
-        
-        # Unique files
+        # File modifications - type counts, line totals and unique files in a single pass
+        created = edited = deleted = 0
+        lines_added = lines_removed = 0
         unique_files: Set[str] = set()
         for m in file_modifications:
+            mod_type = m.modification_type
+            if mod_type == "created":
+                created += 1
+            elif mod_type == "edited":
+                edited += 1
+            elif mod_type == "deleted":
+                deleted += 1
+            lines_added += m.lines_added
+            lines_removed += m.lines_removed
             unique_files.add(m.file_path)
+        metrics.files_created = created
+        metrics.files_edited = edited
+        metrics.files_deleted = deleted
+        metrics.total_lines_added = lines_added
+        metrics.total_lines_removed = lines_removed
         metrics.unique_files_touched = len(unique_files)
         
         # Errors
@@ -560,6 +962,22 @@ class MetricsCalculator:
 class ReportGenerator:
     """Generate session summary reports in various formats."""
     
+    TIMELINE_ICONS = {"tool": "[T]", "file": "[F]", "error": "[!]", "milestone": "[*]"}
+    IMPACT_ICONS = {"critical": "[!]", "major": "[*]", "minor": "[-]"}
+    
+    # Everything after Quick Stats when a session recorded nothing
+    EMPTY_SESSION_MARKDOWN = "\n".join([
+        "## Tool Usage Breakdown", "",
+        "### Top Tools Used", "", "",
+        "## File Modifications", "", "*No file modifications tracked*", "",
+        "## Errors & Solutions", "", "*No errors encountered*", "",
+        "## Key Decisions", "", "*No decisions tracked*", "",
+        "## Milestones", "", "*No milestones defined*", "",
+        "## Timeline", "", "```", "No events recorded", "```", "",
+        "---",
+        "*Generated by SessionDocGen v1.0*",
+    ])
+    
     def __init__(self):
         self.tool_usages: List[ToolUsage] = []
         self.file_modifications: List[FileModification] = []
@@ -614,24 +1032,29 @@ class ReportGenerator:
         lines.append(f"| Milestones | {self.metrics.milestones_achieved} |")
         lines.append("")
         
+        if not (self.tool_usages or self.file_modifications or self.errors
+                or self.decisions or self.milestones):
+            lines.append(self.EMPTY_SESSION_MARKDOWN)
+            return "\n".join(lines)
+        
         # Tool Usage Breakdown
         lines.append("## Tool Usage Breakdown")
         lines.append("")
-        tool_counts = self._count_by_category(self.tool_usages, "category")
+        tool_names, tool_counts = self._get_tool_counts()
         if tool_counts:
             lines.append("| Category | Count | Percentage |")
             lines.append("|----------|-------|------------|")
-            total = sum(tool_counts.values())
-            for cat, count in sorted(tool_counts.items(), key=lambda x: -x[1]):
-                pct = (count / total * 100) if total > 0 else 0
+            # Every usage lands in exactly one category
+            total = len(self.tool_usages)
+            for cat, count in tool_counts.most_common():
+                pct = count / total * 100
                 lines.append(f"| {cat} | {count} | {pct:.1f}% |")
             lines.append("")
         
         # Top Tools
         lines.append("### Top Tools Used")
         lines.append("")
-        tool_names = self._count_by_field(self.tool_usages, "tool_name")
-        for name, count in sorted(tool_names.items(), key=lambda x: -x[1])[:10]:
+        for name, count in tool_names.most_common(10):
             lines.append(f"- `{name}`: {count}")
         lines.append("")
         
@@ -642,7 +1065,7 @@ class ReportGenerator:
             lines.append("| File | Type | Lines +/- |")
             lines.append("|------|------|-----------|")
             for mod in self.file_modifications[:20]:  # Limit to 20
-                file_name = Path(mod.file_path).name
+                file_name = _basename(mod.file_path)
                 lines.append(f"| {file_name} | {mod.modification_type} | +{mod.lines_added}/-{mod.lines_removed} |")
             if len(self.file_modifications) > 20:
                 lines.append(f"| ... | ... | ({len(self.file_modifications) - 20} more) |")
@@ -657,7 +1080,7 @@ class ReportGenerator:
             for error in self.errors[:10]:  # Limit to 10
                 status = "[OK]" if error.effective else "[x]"
                 lines.append(f"### {status} {error.error_id}: {error.error_type.upper()}")
-                lines.append(f"**Error:** {error.error_message[:200]}...")
+                lines.append(f"**Error:** {_ellipsize(error.error_message, 200)}")
                 if error.solution:
                     lines.append(f"**Solution:** {error.solution}")
                 lines.append("")
@@ -680,7 +1103,7 @@ class ReportGenerator:
         lines.append("")
         if self.milestones:
             for ms in self.milestones:
-                impact_emoji = {"critical": "[!]", "major": "[*]", "minor": "[-]"}.get(ms.impact, "[-]")
+                impact_emoji = self.IMPACT_ICONS.get(ms.impact, "[-]")
                 lines.append(f"- {impact_emoji} **{ms.title}**: {ms.description}")
         else:
             lines.append("*No milestones defined*")
@@ -700,9 +1123,21 @@ class ReportGenerator:
         
         return "\n".join(lines)
     
-    def generate_json(self, session_name: str = "Session") -> str:
-        """Generate JSON report."""
-        report = {
+    def generate_json(self, session_name: str = "Session", *, indent: Optional[int] = None) -> str:
+        """Generate JSON report.
+        
+        Output is compact by default, which runs on json's C encoder; pass
+        indent=2 for human-readable output.
+        """
+        return json.dumps(self._json_report(session_name), indent=indent)
+    
+    def write_json(self, fp: Any, session_name: str = "Session", *, indent: Optional[int] = 2) -> None:
+        """Write the JSON report to an open text file without building the string."""
+        json.dump(self._json_report(session_name), fp, indent=indent)
+    
+    def _json_report(self, session_name: str) -> Dict[str, Any]:
+        """Build the JSON report payload."""
+        return {
             "session_name": session_name,
             "generated_at": datetime.now().isoformat(),
             "metrics": self.metrics.to_dict(),
@@ -712,7 +1147,6 @@ class ReportGenerator:
             "decisions": [d.to_dict() for d in self.decisions],
             "milestones": [m.to_dict() for m in self.milestones]
         }
-        return json.dumps(report, indent=2)
     
     def generate_text(self, session_name: str = "Session") -> str:
         """Generate plain text report."""
@@ -742,8 +1176,8 @@ class ReportGenerator:
         lines.append("-" * 60)
         lines.append("TOP TOOLS")
         lines.append("-" * 60)
-        tool_names = self._count_by_field(self.tool_usages, "tool_name")
-        for i, (name, count) in enumerate(sorted(tool_names.items(), key=lambda x: -x[1])[:5], 1):
+        tool_names = Counter(usage.tool_name for usage in self.tool_usages)
+        for i, (name, count) in enumerate(tool_names.most_common(5), 1):
             lines.append(f"  {i}. {name}: {count}")
         lines.append("")
         lines.append(sep)
@@ -752,53 +1186,50 @@ class ReportGenerator:
         
         return "\n".join(lines)
     
-    def _count_by_category(self, items: List[Any], field: str) -> Dict[str, int]:
-        """Count items by a category field."""
-        counts: Dict[str, int] = defaultdict(int)
-        for item in items:
-            value = getattr(item, field, "unknown")
-            counts[value] += 1
-        return dict(counts)
-    
-    def _count_by_field(self, items: List[Any], field: str) -> Dict[str, int]:
-        """Count items by a field."""
-        counts: Dict[str, int] = defaultdict(int)
-        for item in items:
-            value = getattr(item, field, "unknown")
-            counts[value] += 1
-        return dict(counts)
+    def _get_tool_counts(self) -> Tuple[Counter, Counter]:
+        """Count tool usages by name and by category in a single pass."""
+        names: Counter = Counter()
+        categories: Counter = Counter()
+        for usage in self.tool_usages:
+            names[usage.tool_name] += 1
+            categories[usage.category] += 1
+        return names, categories
     
     def _generate_ascii_timeline(self) -> str:
         """Generate an ASCII timeline of events."""
-        events = []
+        events: List[Tuple[datetime, str, Any]] = []
+        append = events.append
         
-        # Collect all timestamped events
+        # Collect all timestamped events; labels are only built for the
+        # handful of events that end up shown
         for usage in self.tool_usages:
-            events.append((usage.timestamp, "tool", usage.tool_name))
+            append((usage.timestamp, "tool", usage))
         for mod in self.file_modifications:
-            events.append((mod.timestamp, "file", f"{mod.modification_type}: {Path(mod.file_path).name}"))
+            append((mod.timestamp, "file", mod))
         for error in self.errors:
-            events.append((error.timestamp, "error", error.error_type))
+            append((error.timestamp, "error", error))
         for ms in self.milestones:
-            events.append((ms.timestamp, "milestone", ms.title))
+            append((ms.timestamp, "milestone", ms))
         
         if not events:
             return "No events recorded"
         
-        # Sort by timestamp
-        events.sort(key=lambda x: x[0])
+        # Sort by timestamp (stable, so same-time events keep source order)
+        events.sort(key=itemgetter(0))
         
         # Generate timeline (show key events)
         lines = []
         shown = 0
         prev_type = None
         
-        for ts, event_type, desc in events:
+        for ts, event_type, item in events:
             # Show milestones and errors always, compress sequential same-type events
             if event_type in ("milestone", "error") or event_type != prev_type or shown < 10:
-                icon = {"tool": "[T]", "file": "[F]", "error": "[!]", "milestone": "[*]"}.get(event_type, "[-]")
-                time_str = ts.strftime("%H:%M:%S")
-                lines.append(f"{time_str} {icon} {desc[:40]}")
+                icon = self.TIMELINE_ICONS.get(event_type, "[-]")
+                # Same as strftime("%H:%M:%S") without the format parsing
+                time_str = ts.time().isoformat(timespec="seconds")
+                desc = self._timeline_label(event_type, item)
+                lines.append(f"{time_str} {icon} {_ellipsize(desc, 40)}")
                 shown += 1
             prev_type = event_type
             
@@ -807,6 +1238,17 @@ class ReportGenerator:
                 break
         
         return "\n".join(lines)
+    
+    @staticmethod
+    def _timeline_label(event_type: str, item: Any) -> str:
+        """Describe a timeline event."""
+        if event_type == "tool":
+            return item.tool_name
+        if event_type == "file":
+            return f"{item.modification_type}: {_basename(item.file_path)}"
+        if event_type == "error":
+            return item.error_type
+        return item.title
 
 
 # ============================================================================
@@ -838,24 +1280,54 @@ class SessionDocGen:
     
     def load_log_file(self, log_path: str) -> None:
         """Load and parse a log file."""
-        tool_usages, errors = self.tool_parser.parse_log_file(log_path)
-        self.tool_usages.extend(tool_usages)
-        self.errors.extend(errors)
+        # Map the file once and let every parser scan the same buffer
+        with _map_log_file(log_path) as content:
+            tool_usages, errors = self.tool_parser._parse_scannable(content)
+            decisions = self.decision_parser._parse_scannable(content)
         
-        # Extract file modifications from tool usages
-        file_mods = self.file_parser.parse_from_tool_usages(tool_usages)
-        self.file_modifications.extend(file_mods)
-        
-        # Read file content for decision parsing
-        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        self._add_parsed(tool_usages, errors, decisions)
+    
+    def load_log_files(
+        self,
+        log_paths: Sequence[str],
+        workers: int = 1
+    ) -> None:
+        """Load and parse several log files, optionally in worker processes.
         
-        decisions = self.decision_parser.parse_content(content)
-        self.decisions.extend(decisions)
+        With workers of 2 or more the files are parsed in a process pool; on
+        spawn platforms the calling script then needs an
+        if __name__ == "__main__" guard. Results are merged in path order,
+        with error and decision ids numbered as if each file had been loaded
+        with load_log_file.
+        """
+        # Regex scanning holds the GIL, so the files go to worker processes;
+        # a single worker would only add pickling on top of the same scans
+        workers = min(workers, len(log_paths), _available_cpus())
+        if workers < 2:
+            for log_path in log_paths:
+                self.load_log_file(log_path)
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_parse_log_path, log_paths))
+        
+        for tool_usages, errors, decisions in results:
+            # Each worker numbered from 1; continue this session's sequence
+            for error in errors:
+                self.tool_parser._error_counter += 1
+                error.error_id = f"ERR_{self.tool_parser._error_counter:04d}"
+            for decision in decisions:
+                self.decision_parser._decision_counter += 1
+                decision.decision_id = f"DEC_{self.decision_parser._decision_counter:04d}"
+            self._add_parsed(tool_usages, errors, decisions)
     
-    def load_content(self, content: str) -> None:
-        """Load and parse content string."""
-        tool_usages, errors = self.tool_parser.parse_content(content)
+    def _add_parsed(
+        self,
+        tool_usages: List[ToolUsage],
+        errors: List[ErrorSolution],
+        decisions: List[Decision]
+    ) -> None:
+        """Merge one log's parse results into the session."""
         self.tool_usages.extend(tool_usages)
         self.errors.extend(errors)
         
@@ -863,9 +1335,20 @@ class SessionDocGen:
         file_mods = self.file_parser.parse_from_tool_usages(tool_usages)
         self.file_modifications.extend(file_mods)
         
-        decisions = self.decision_parser.parse_content(content)
         self.decisions.extend(decisions)
     
+    def load_log_stream(self, stream: IO[Any]) -> None:
+        """Load and parse a log from an open text or binary stream, such as stdin."""
+        self.load_content(stream.read())
+    
+    def load_content(self, content: Content) -> None:
+        """Load and parse content (a string or bytes)."""
+        # Decode/normalize once for both parsers
+        content = _scannable(content)
+        tool_usages, errors = self.tool_parser._parse_scannable(content)
+        decisions = self.decision_parser._parse_scannable(content)
+        self._add_parsed(tool_usages, errors, decisions)
+    
     def load_git_diff(self, diff_content: str) -> None:
         """Load file modifications from git diff."""
         file_mods = self.file_parser.parse_from_git_diff(diff_content)
@@ -948,6 +1431,20 @@ class SessionDocGen:
         session_name: Optional[str] = None
     ) -> str:
         """Generate session report."""
+        self._prepare_report()
+        name = session_name or self.session_name
+        
+        if format == "markdown" or format == "md":
+            return self.report_generator.generate_markdown(name)
+        elif format == "json":
+            return self.report_generator.generate_json(name, indent=2)
+        elif format == "text" or format == "txt":
+            return self.report_generator.generate_text(name)
+        else:
+            raise ValueError(f"Unknown format: {format}. Use 'markdown', 'json', or 'text'")
+    
+    def _prepare_report(self) -> None:
+        """Calculate metrics if needed and hand the session data to the report generator."""
         # Calculate metrics if not done
         if self.metrics.total_tool_calls == 0 and self.tool_usages:
             self.calculate_metrics()
@@ -961,17 +1458,6 @@ class SessionDocGen:
             self.milestones,
             self.metrics
         )
-        
-        name = session_name or self.session_name
-        
-        if format == "markdown" or format == "md":
-            return self.report_generator.generate_markdown(name)
-        elif format == "json":
-            return self.report_generator.generate_json(name)
-        elif format == "text" or format == "txt":
-            return self.report_generator.generate_text(name)
-        else:
-            raise ValueError(f"Unknown format: {format}. Use 'markdown', 'json', or 'text'")
     
     def save_report(
         self,
@@ -980,10 +1466,20 @@ class SessionDocGen:
         session_name: Optional[str] = None
     ) -> str:
         """Generate and save report to file."""
-        report = self.generate_report(format, session_name)
+        if format == "json":
+            # Stream JSON straight to the file instead of building the string first
+            self._prepare_report()
+            with open(output_path, 'w', encoding='utf-8') as f:
+                self.report_generator.write_json(f, session_name or self.session_name)
+        else:
+            report = self.generate_report(format, session_name)
+            
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(report)
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(report)
+        # Milestones appended to the old report must not carry over to this
+        # one; only drop them once the new report is in place
+        _discard_milestone_sidecar(output_path)
         
         return output_path
     
@@ -1016,6 +1512,113 @@ class SessionDocGen:
         self.end_time = None
 
 
+# ============================================================================
+# SAVED REPORTS
+# ============================================================================
+
+MILESTONE_SIDECAR_SUFFIX = ".milestones.jsonl"
+
+
+def milestone_sidecar_path(report_path: str) -> str:
+    """Path of the JSONL file that milestones for a saved report are appended to."""
+    return report_path + MILESTONE_SIDECAR_SUFFIX
+
+
+# Bytes read per step when scanning a sidecar backwards for its last entry
+_SIDECAR_TAIL_BLOCK = 4096
+
+
+def load_json_report(report_path: str) -> Dict[str, Any]:
+    """Load a saved JSON report, merging in milestones from its sidecar.
+    
+    Malformed sidecar lines (e.g. a write cut short) are skipped.
+    """
+    with open(report_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    sidecar = milestone_sidecar_path(report_path)
+    if os.path.exists(sidecar):
+        milestones = data.setdefault("milestones", [])
+        with open(sidecar, 'rb') as f:
+            for line in f:
+                milestone = _parse_sidecar_line(line)
+                if milestone is not None:
+                    milestones.append(milestone)
+    
+    return data
+
+
+def _parse_sidecar_line(line: bytes) -> Optional[Dict[str, Any]]:
+    """Decode one sidecar line; None if it is blank or not a milestone."""
+    if not line.strip():
+        return None
+    try:
+        milestone = json.loads(line)
+        int(milestone["milestone_id"][3:])
+    except (ValueError, TypeError, KeyError):
+        return None
+    return milestone
+
+
+def _last_sidecar_milestone(sidecar: str) -> Optional[Dict[str, Any]]:
+    """Return the last well-formed milestone in a sidecar.
+    
+    The file is read backwards a block at a time, so appends stay cheap
+    however long the sidecar grows.
+    """
+    with open(sidecar, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        pending = b""
+        while pos > 0:
+            step = min(_SIDECAR_TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + pending).split(b"\n")
+            # The first piece may continue in the block before this one
+            pending = lines.pop(0) if pos > 0 else b""
+            for line in reversed(lines):
+                milestone = _parse_sidecar_line(line)
+                if milestone is not None:
+                    return milestone
+    return None
+
+
+def _recorded_milestone_count(report_path: str) -> int:
+    """Count milestones recorded for a saved report.
+    
+    Sidecar milestones are numbered after the report's own, so once the
+    sidecar has entries the last one's id gives the count without
+    loading the report.
+    """
+    sidecar = milestone_sidecar_path(report_path)
+    if os.path.exists(sidecar):
+        last = _last_sidecar_milestone(sidecar)
+        if last is not None:
+            return int(last["milestone_id"][3:])
+    
+    with open(report_path, 'r', encoding='utf-8') as f:
+        return len(json.load(f).get("milestones", []))
+
+
+def _append_sidecar_milestone(report_path: str, milestone: Dict[str, Any]) -> None:
+    """Append one milestone line to a report's sidecar."""
+    with open(milestone_sidecar_path(report_path), 'ab+') as f:
+        # Start on a fresh line if the last write was cut short
+        if f.seek(0, os.SEEK_END) > 0:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write(json.dumps(milestone).encode('utf-8') + b"\n")
+
+
+def _discard_milestone_sidecar(report_path: str) -> None:
+    """Remove a report's sidecar once the report itself is rewritten."""
+    try:
+        os.remove(milestone_sidecar_path(report_path))
+    except FileNotFoundError:
+        pass
+
+
 # ============================================================================
 # CLI
 # ============================================================================
@@ -1051,18 +1654,22 @@ Built by ATLAS (Team Brain) for IRIS
     
     # Parse command
     parse_parser = subparsers.add_parser("parse", help="Parse log files and generate report")
-    parse_parser.add_argument("logs", nargs="+", help="Log files to parse")
+    parse_parser.add_argument("logs", nargs="+", help="Log files to parse (- reads stdin)")
     parse_parser.add_argument("-o", "--output", help="Output file path")
     parse_parser.add_argument("-f", "--format", choices=["markdown", "md", "json", "text", "txt"],
                               default="markdown", help="Output format (default: markdown)")
     parse_parser.add_argument("-n", "--name", default="Session", help="Session name")
     parse_parser.add_argument("--git-diff", help="Git diff file for file modifications")
     parse_parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parse_parser.add_argument("-j", "--workers", type=int, default=1,
+                              help="Parse log files in this many worker processes")
     
     # Summary command
     summary_parser = subparsers.add_parser("summary", help="Quick summary to stdout")
-    summary_parser.add_argument("logs", nargs="+", help="Log files to parse")
+    summary_parser.add_argument("logs", nargs="+", help="Log files to parse (- reads stdin)")
     summary_parser.add_argument("-n", "--name", default="Session", help="Session name")
+    summary_parser.add_argument("-j", "--workers", type=int, default=1,
+                                help="Parse log files in this many worker processes")
     
     # Milestone command
     milestone_parser = subparsers.add_parser("milestone", help="Add milestone to existing report")
@@ -1071,17 +1678,53 @@ Built by ATLAS (Team Brain) for IRIS
     milestone_parser.add_argument("-i", "--impact", choices=["minor", "major", "critical"],
                                    default="minor", help="Impact level")
     milestone_parser.add_argument("-r", "--report", required=True, help="Report JSON file to update")
+    milestone_parser.add_argument("--sidecar", action="store_true",
+                                  help="Append to <report>.milestones.jsonl instead of rewriting the report")
     
     # Stats command
     stats_parser = subparsers.add_parser("stats", help="Show tool usage statistics")
-    stats_parser.add_argument("logs", nargs="+", help="Log files to analyze")
+    stats_parser.add_argument("logs", nargs="+", help="Log files to analyze (- reads stdin)")
+    stats_parser.add_argument("-j", "--workers", type=int, default=1,
+                              help="Parse log files in this many worker processes")
     
     return parser
 
 
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser once per process for repeated main() calls."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = create_parser()
+    return _PARSER
+
+
+def _load_log_arg(generator: SessionDocGen, log_path: str) -> bool:
+    """Load one CLI log argument ("-" reads stdin); False if the file is missing."""
+    if log_path == "-":
+        # Read raw bytes so stdin decodes like a log file, whatever the locale
+        generator.load_log_stream(getattr(sys.stdin, "buffer", sys.stdin))
+        return True
+    if not os.path.exists(log_path):
+        return False
+    generator.load_log_file(log_path)
+    return True
+
+
+def _load_log_args(generator: SessionDocGen, log_paths: Sequence[str], workers: int = 1) -> Set[str]:
+    """Load all CLI log arguments, batching files for parallel parsing; returns the missing paths."""
+    if "-" in log_paths:
+        return {log_path for log_path in log_paths if not _load_log_arg(generator, log_path)}
+    missing = {log_path for log_path in log_paths if not os.path.exists(log_path)}
+    generator.load_log_files([log_path for log_path in log_paths if log_path not in missing], workers)
+    return missing
+
+
 def main() -> int:
     """Main entry point."""
-    parser = create_parser()
+    parser = _get_parser()
     args = parser.parse_args()
     
     if not args.command:
@@ -1090,11 +1733,18 @@ def main() -> int:
     
     generator = SessionDocGen()
     
+    if args.command in ("parse", "summary", "stats"):
+        try:
+            missing = _load_log_args(generator, args.logs, args.workers)
+        except FileNotFoundError as e:
+            # A log that vanished after the missing-file check
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    
     if args.command == "parse":
-        # Parse all log files
+        # Report on each log file
         for log_path in args.logs:
-            if os.path.exists(log_path):
-                generator.load_log_file(log_path)
+            if log_path not in missing:
                 if args.verbose:
                     print(f"Parsed: {log_path}")
             else:
@@ -1109,35 +1759,32 @@ def main() -> int:
         
         generator.session_name = args.name
         
-        # Generate report
-        report = generator.generate_report(format=args.format, session_name=args.name)
-        
+        # Generate report; saved JSON streams straight to the file
         if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(report)
+            generator.save_report(args.output, format=args.format, session_name=args.name)
             print(f"Report saved to: {args.output}")
         else:
-            print(report)
+            print(generator.generate_report(format=args.format, session_name=args.name))
         
         return 0
     
     elif args.command == "summary":
-        # Parse and show quick summary
-        for log_path in args.logs:
-            if os.path.exists(log_path):
-                generator.load_log_file(log_path)
-        
+        # Show quick summary
         generator.session_name = args.name
         summary = generator.get_summary()
         
-        print(f"\n=== {summary['session_name']} Summary ===")
-        print(f"Duration:       {summary['duration_minutes']:.1f} minutes")
-        print(f"Tool Calls:     {summary['tool_calls']}")
-        print(f"Files Touched:  {summary['files_touched']}")
-        print(f"Errors:         {summary['errors']} ({summary['errors_resolved']} resolved)")
-        print(f"Decisions:      {summary['decisions']}")
-        print(f"Milestones:     {summary['milestones']}")
-        print()
+        # Emit the whole block in one write instead of a print per line
+        lines = [
+            f"\n=== {summary['session_name']} Summary ===",
+            f"Duration:       {summary['duration_minutes']:.1f} minutes",
+            f"Tool Calls:     {summary['tool_calls']}",
+            f"Files Touched:  {summary['files_touched']}",
+            f"Errors:         {summary['errors']} ({summary['errors_resolved']} resolved)",
+            f"Decisions:      {summary['decisions']}",
+            f"Milestones:     {summary['milestones']}",
+            "",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return 0
     
@@ -1147,12 +1794,20 @@ def main() -> int:
             print(f"Error: Report file not found: {args.report}", file=sys.stderr)
             return 1
         
-        with open(args.report, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Once a sidecar is in use, milestones keep going there
+        sidecar = milestone_sidecar_path(args.report)
+        use_sidecar = args.sidecar or os.path.exists(sidecar)
+        
+        if use_sidecar:
+            count = _recorded_milestone_count(args.report)
+        else:
+            with open(args.report, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            count = len(data.get('milestones', []))
         
         # Add milestone
         new_milestone = {
-            "milestone_id": f"MS_{len(data.get('milestones', [])) + 1:04d}",
+            "milestone_id": f"MS_{count + 1:04d}",
             "title": args.title,
             "timestamp": datetime.now().isoformat(),
             "description": args.description,
@@ -1160,52 +1815,50 @@ def main() -> int:
             "related_decisions": []
         }
         
-        if "milestones" not in data:
-            data["milestones"] = []
-        data["milestones"].append(new_milestone)
-        
-        # Save updated report
-        with open(args.report, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        if use_sidecar:
+            # Append one line instead of rewriting the whole report
+            _append_sidecar_milestone(args.report, new_milestone)
+        else:
+            if "milestones" not in data:
+                data["milestones"] = []
+            data["milestones"].append(new_milestone)
+            
+            # Save updated report
+            with open(args.report, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
         
         print(f"Added milestone: {args.title}")
         return 0
     
     elif args.command == "stats":
         # Show statistics
-        for log_path in args.logs:
-            if os.path.exists(log_path):
-                generator.load_log_file(log_path)
-        
-        generator.calculate_metrics()
-        
-        print("\n=== Tool Usage Statistics ===\n")
-        
-        # Category breakdown
-        category_counts: Dict[str, int] = defaultdict(int)
-        tool_counts: Dict[str, int] = defaultdict(int)
+        metrics = generator.calculate_metrics()
         
-        for usage in generator.tool_usages:
-            category_counts[usage.category] += 1
-            tool_counts[usage.tool_name] += 1
+        # Category breakdown, counted while calculating metrics
+        category_counts = Counter(metrics.category_counts)
+        tool_counts = Counter(metrics.tool_name_counts)
+        total = metrics.total_tool_calls
         
-        total = len(generator.tool_usages)
+        # Collect the output and emit it in one write
+        lines = ["\n=== Tool Usage Statistics ===\n"]
+        append = lines.append
         
-        print("By Category:")
-        print("-" * 40)
-        for cat, count in sorted(category_counts.items(), key=lambda x: -x[1]):
+        append("By Category:")
+        append("-" * 40)
+        for cat, count in category_counts.most_common():
             pct = (count / total * 100) if total > 0 else 0
             bar = "#" * int(pct / 5)
-            print(f"  {cat:12s} {count:4d} ({pct:5.1f}%) {bar}")
+            append(f"  {cat:12s} {count:4d} ({pct:5.1f}%) {bar}")
         
-        print("\nTop 10 Tools:")
-        print("-" * 40)
-        for name, count in sorted(tool_counts.items(), key=lambda x: -x[1])[:10]:
+        append("\nTop 10 Tools:")
+        append("-" * 40)
+        for name, count in tool_counts.most_common(10):
             pct = (count / total * 100) if total > 0 else 0
-            print(f"  {name:30s} {count:4d} ({pct:5.1f}%)")
+            append(f"  {name:30s} {count:4d} ({pct:5.1f}%)")
         
-        print(f"\nTotal Tool Calls: {total}")
-        print()
+        append(f"\nTotal Tool Calls: {total}")
+        append("")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return 0
     
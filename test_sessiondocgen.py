@@ -20,11 +20,16 @@ Built by ATLAS (Team Brain) for IRIS
 import os
 import sys
 import json
+import stat
+import subprocess
 import tempfile
+import threading
+import tracemalloc
 import unittest
+from contextlib import redirect_stdout
 from datetime import datetime, timedelta
 from pathlib import Path
-from io import StringIO
+from io import BytesIO, StringIO, TextIOWrapper
 from unittest.mock import patch, MagicMock
 
 # Import the module under test
@@ -42,6 +47,8 @@ from sessiondocgen import (
     ReportGenerator,
     SessionDocGen,
     TOOL_CATEGORIES,
+    parse_session,
+    load_json_report,
     create_parser,
     main
 )
@@ -130,6 +137,19 @@ class TestFileModification(unittest.TestCase):
         self.assertEqual(d["file_path"], "src/main.py")
         self.assertEqual(d["lines_added"], 50)
         self.assertEqual(d["lines_removed"], 10)
+    
+    def test_to_dict_timestamps_follow_each_record(self):
+        """Test shared and distinct timestamps serialize correctly in sequence."""
+        first = datetime(2026, 1, 25, 10, 30, 0)
+        second = datetime(2026, 1, 25, 11, 0, 0)
+        mods = [
+            FileModification(file_path=name, modification_type="edited", timestamp=ts)
+            for name, ts in (("a.py", first), ("b.py", first), ("c.py", second), ("d.py", first))
+        ]
+        self.assertEqual(
+            [m.to_dict()["timestamp"] for m in mods],
+            [first.isoformat(), first.isoformat(), second.isoformat(), first.isoformat()]
+        )
 
 
 class TestDecision(unittest.TestCase):
@@ -157,6 +177,28 @@ class TestDecision(unittest.TestCase):
         d = dec.to_dict()
         self.assertEqual(d["category"], "architecture")
         self.assertEqual(d["rationale"], "Zero dependencies")
+    
+    def test_list_fields_not_shared(self):
+        """Test list fields start empty and are not shared between records."""
+        first = Decision(decision_id="DEC_0003", description="Use SQLite",
+                         timestamp=datetime.now())
+        second = Decision(decision_id="DEC_0004", description="Use JSON",
+                          timestamp=datetime.now())
+        first.alternatives_considered.append("PostgreSQL")
+        first.alternatives_considered.append("Redis")
+        self.assertEqual(first.to_dict()["alternatives_considered"], ["PostgreSQL", "Redis"])
+        self.assertEqual(second.to_dict()["alternatives_considered"], [])
+
+    def test_list_fields_are_mutable_lists(self):
+        """Test list fields of a fresh record accept direct appends."""
+        dec = Decision(decision_id="DEC_0005", description="Use SQLite",
+                       timestamp=datetime.now())
+        dec.related_files.append("db.py")
+        err = ErrorSolution(error_id="ERR_0003", error_type="runtime",
+                            error_message="boom", timestamp=datetime.now())
+        err.solution_steps.append("restart")
+        self.assertEqual(dec.to_dict()["related_files"], ["db.py"])
+        self.assertEqual(err.to_dict()["solution_steps"], ["restart"])
 
 
 class TestErrorSolution(unittest.TestCase):
@@ -262,6 +304,32 @@ class TestToolUsageParser(unittest.TestCase):
         self.assertEqual(usages[0].tool_name, "read_file")
         self.assertEqual(usages[1].tool_name, "write")
     
+    def test_parse_fallback_stops_at_first_matching_format(self):
+        """Test fallback formats are not mixed once one format matches."""
+        content = '<tool name="grep">TODO</tool> then print(x)'
+        usages, _ = self.parser.parse_content(content)
+        self.assertEqual([u.tool_name for u in usages], ["grep"])
+    
+    def test_parse_function_style_ignores_unknown_calls(self):
+        """Test function-style parsing only reports known tools."""
+        content = 'print(x)\nread_file(target_file="a.py")\nlen(data)'
+        usages, _ = self.parser.parse_content(content)
+        self.assertEqual([u.tool_name for u in usages], ["read_file"])
+    
+    def test_parse_errors_match_full_scan(self):
+        """Test trigger-anchored error scan finds what each pattern's finditer does."""
+        content = (
+            "Build FAILED: step 2\nterror: no\nTraceback (most recent call last):\n"
+            "  File \"a.py\"\nValueError: bad\nExit code: 2\nexit code: 0\nERROR: disk full\n"
+        )
+        expected = [
+            (m.group(1) if m.lastindex else m.group(0)).strip()
+            for pattern in ToolUsageParser.ERROR_PATTERNS
+            for m in pattern.finditer(content)
+        ]
+        _, errors = self.parser.parse_content(content)
+        self.assertEqual([e.error_message for e in errors], expected)
+    
     def test_parse_categorizes_tools(self):
         """Test that tools are categorized correctly."""
         content = '<invoke name="grep"></invoke>'
@@ -301,7 +369,12 @@ class TestToolUsageParser(unittest.TestCase):
         """Test network error categorization."""
         error_type = self.parser._categorize_error("Connection timeout after 30s")
         self.assertEqual(error_type, "network")
-    
+
+    def test_categorize_uses_category_priority(self):
+        """Test earlier categories win regardless of keyword position."""
+        error_type = self.parser._categorize_error("HTTP request failed: pip not found")
+        self.assertEqual(error_type, "dependency")
+
     def test_parse_log_file(self):
         """Test parsing from file."""
         with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
@@ -313,7 +386,55 @@ class TestToolUsageParser(unittest.TestCase):
             self.assertEqual(len(usages), 1)
         finally:
             os.unlink(temp_path)
-    
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "needs named pipes")
+    def test_parse_log_file_fifo(self):
+        """Test parsing a FIFO, which reports size 0, reads its content."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fifo_path = os.path.join(temp_dir, "session.log")
+            os.mkfifo(fifo_path)
+
+            def write_log():
+                with open(fifo_path, 'w') as f:
+                    f.write('<invoke name="grep"></invoke>\nError: disk full\n')
+
+            writer = threading.Thread(target=write_log)
+            writer.start()
+            try:
+                usages, errors = self.parser.parse_log_file(fifo_path)
+            finally:
+                writer.join()
+
+        self.assertEqual([u.tool_name for u in usages], ["grep"])
+        self.assertIn("Error: disk full", [e.error_message for e in errors])
+
+    def test_parse_log_file_decodes_matches(self):
+        """Test file parsing yields str fields for tools and errors."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False,
+                                         encoding='utf-8') as f:
+            f.write('<invoke name="grep"></invoke>\nError: café not found\n')
+            temp_path = f.name
+
+        try:
+            usages, errors = self.parser.parse_log_file(temp_path)
+            self.assertEqual(usages[0].tool_name, "grep")
+            self.assertEqual(usages[0].category, "search")
+            self.assertTrue(any("café" in e.error_message for e in errors))
+        finally:
+            os.unlink(temp_path)
+
+    def test_parse_log_file_empty(self):
+        """Test parsing an empty log file."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
+            temp_path = f.name
+
+        try:
+            usages, errors = self.parser.parse_log_file(temp_path)
+            self.assertEqual(usages, [])
+            self.assertEqual(errors, [])
+        finally:
+            os.unlink(temp_path)
+
     def test_parse_log_file_not_found(self):
         """Test FileNotFoundError for missing log file."""
         with self.assertRaises(FileNotFoundError):
@@ -339,6 +460,19 @@ class TestFileModificationParser(unittest.TestCase):
         self.assertEqual(len(mods), 1)
         self.assertEqual(mods[0].file_path, "new_file.py")
     
+    def test_parse_from_tool_usages_write_stats_each_path_once(self):
+        """Test repeated writes to one path only check existence once."""
+        usages = [
+            ToolUsage(tool_name="write", timestamp=datetime.now(),
+                      arguments={"file_path": "new_file.py"})
+            for _ in range(5)
+        ]
+        with patch('sessiondocgen.os.path.exists', return_value=False) as mock_exists:
+            mods = self.parser.parse_from_tool_usages(usages)
+        self.assertEqual(len(mods), 5)
+        self.assertEqual(mock_exists.call_count, 1)
+        self.assertTrue(all(m.modification_type == "created" for m in mods))
+    
     def test_parse_from_tool_usages_search_replace(self):
         """Test extracting modifications from search_replace tool."""
         usages = [
@@ -400,6 +534,12 @@ diff --git a/file2.py b/file2.py
 '''
         mods = self.parser.parse_from_git_diff(diff)
         self.assertEqual(len(mods), 2)
+    
+    def test_parse_from_git_diff_crlf(self):
+        """Test CRLF diffs count the same as LF diffs."""
+        diff = "diff --git a/a.py b/a.py\r\n--- a/a.py\r\n+++ b/a.py\r\n+x\r\n-y\r\n-z\r\n"
+        mods = self.parser.parse_from_git_diff(diff)
+        self.assertEqual([(m.file_path, m.lines_added, m.lines_removed) for m in mods], [("a.py", 1, 2)])
 
 
 class TestDecisionParser(unittest.TestCase):
@@ -458,6 +598,65 @@ class TestDecisionParser(unittest.TestCase):
         """
         decisions = self.parser.parse_content(content)
         self.assertGreaterEqual(len(decisions), 2)
+    
+    def test_parse_bytes_matches_text(self):
+        """Test bytes content yields the same decisions as text."""
+        content = "Setup done. We decided to use caf\u00e9 caching! The fix was simple\nok"
+        from_text = [d.description for d in self.parser.parse_content(content)]
+        from_bytes = [d.description for d in self.parser.parse_content(content.encode('utf-8'))]
+        self.assertEqual(from_text, ["We decided to use caf\u00e9 caching", "The fix was simple"])
+        self.assertEqual(from_bytes, from_text)
+
+
+class TestParseSession(unittest.TestCase):
+    """Test parse_session helper."""
+    
+    CONTENT = (
+        '<invoke name="read_file"></invoke>\n'
+        'Error: ModuleNotFoundError\n'
+        'We decided to use caching.\n'
+    )
+    
+    def test_parse_inline(self):
+        """Test content is parsed without worker processes by default."""
+        usages, errors, decisions = parse_session(self.CONTENT)
+        self.assertEqual([u.tool_name for u in usages], ["read_file"])
+        self.assertGreater(len(errors), 0)
+        self.assertGreater(len(decisions), 0)
+    
+    def test_parse_default_skips_pool(self):
+        """Test large content stays inline unless workers are requested."""
+        with patch('sessiondocgen._available_cpus', return_value=3), \
+                patch('sessiondocgen.ProcessPoolExecutor',
+                      side_effect=AssertionError("pool used")):
+            usages, _, _ = parse_session(self.CONTENT * 50000)
+        self.assertEqual(len(usages), 50000)
+    
+    def test_parse_parallel_matches_inline(self):
+        """Test worker-process parsing gives the same results."""
+        inline = parse_session(self.CONTENT)
+        with patch('sessiondocgen._available_cpus', return_value=3):
+            parallel = parse_session(self.CONTENT, workers=3)
+        for expected, actual in zip(inline, parallel):
+            self.assertEqual(
+                [{**r.to_dict(), "timestamp": None} for r in expected],
+                [{**r.to_dict(), "timestamp": None} for r in actual]
+            )
+    
+    def test_parse_crlf_matches_parse_content(self):
+        """Test CRLF and non-ASCII content parse as ToolUsageParser.parse_content does."""
+        content = (
+            'Traceback (most recent call last):\r\n  File "a"\r\n\r\n'
+            'Error: x\r\n<invoke name="grep">\r\n<tool name="café">y</tool>\r\n'
+        )
+        expected_usages, expected_errors = ToolUsageParser().parse_content(content)
+        for cpus in (1, 3):
+            with patch('sessiondocgen._available_cpus', return_value=cpus):
+                usages, errors, _ = parse_session(content, workers=3)
+            self.assertEqual([u.tool_name for u in usages], [u.tool_name for u in expected_usages])
+            self.assertEqual([e.error_message for e in errors],
+                             [e.error_message for e in expected_errors])
+            self.assertFalse(any('\r' in e.error_message for e in errors))
 
 
 # ============================================================================
@@ -487,6 +686,18 @@ class TestMetricsCalculator(unittest.TestCase):
         self.assertEqual(metrics.total_tool_calls, 3)
         self.assertEqual(metrics.successful_tool_calls, 2)
     
+    def test_calculate_tool_counts(self):
+        """Test per-category and per-name tool counts."""
+        usages = [
+            ToolUsage(tool_name="read_file", timestamp=datetime.now(), category="read"),
+            ToolUsage(tool_name="grep", timestamp=datetime.now(), category="search"),
+            ToolUsage(tool_name="read_file", timestamp=datetime.now(), category="read"),
+        ]
+        metrics = self.calculator.calculate(usages, [], [], [], [])
+        self.assertEqual(metrics.category_counts, {"read": 2, "search": 1})
+        self.assertEqual(metrics.tool_name_counts, {"read_file": 2, "grep": 1})
+        self.assertEqual(metrics.to_dict()["category_counts"], {"read": 2, "search": 1})
+    
     def test_calculate_file_modifications(self):
         """Test file modification counting."""
         mods = [
@@ -625,6 +836,37 @@ class TestReportGenerator(unittest.TestCase):
         self.assertIn("| Metric | Value |", report)
         self.assertIn("Total Tool Calls", report)
     
+    def test_generate_markdown_ellipsizes_only_long_errors(self):
+        """Test error messages get "..." only when truncated."""
+        self.errors.append(
+            ErrorSolution(error_id="ERR_0002", error_type="runtime",
+                        error_message="x" * 250, timestamp=datetime.now())
+        )
+        self.generator.set_data(
+            self.tool_usages, self.file_mods, self.errors,
+            self.decisions, self.milestones, self.metrics
+        )
+        report = self.generator.generate_markdown()
+        
+        self.assertIn("**Error:** Invalid syntax\n", report)
+        self.assertIn(f"**Error:** {'x' * 200}...\n", report)
+    
+    def test_generate_markdown_shows_file_basenames(self):
+        """Test file table shows basenames for / and \\ paths."""
+        now = datetime.now()
+        self.file_mods = [
+            FileModification(file_path="src/app/main.py", modification_type="edited", timestamp=now),
+            FileModification(file_path="C:\\proj\\util.py", modification_type="created", timestamp=now),
+        ]
+        self.generator.set_data(
+            self.tool_usages, self.file_mods, self.errors,
+            self.decisions, self.milestones, self.metrics
+        )
+        report = self.generator.generate_markdown()
+        
+        self.assertIn("| main.py | edited |", report)
+        self.assertIn("| util.py | created |", report)
+    
     def test_generate_json_basic(self):
         """Test basic JSON generation."""
         self.generator.set_data(
@@ -650,6 +892,43 @@ class TestReportGenerator(unittest.TestCase):
         self.assertIsInstance(data["tool_usages"], list)
         self.assertIsInstance(data["metrics"], dict)
     
+    def test_generate_json_indent(self):
+        """Test JSON is compact by default and indented on request."""
+        self.generator.set_data(
+            self.tool_usages, self.file_mods, self.errors,
+            self.decisions, self.milestones, self.metrics
+        )
+        compact = self.generator.generate_json("Test")
+        pretty = self.generator.generate_json("Test", indent=2)
+        
+        self.assertNotIn("\n", compact)
+        self.assertIn('\n  "session_name": "Test"', pretty)
+        self.assertEqual(json.loads(compact)["tool_usages"], json.loads(pretty)["tool_usages"])
+
+    def test_generate_text_follows_new_tool_data(self):
+        """Test tool counts are recomputed for replaced and edited lists."""
+        self.generator.set_data(
+            [ToolUsage(tool_name="alpha", timestamp=datetime.now())], [], [], [], [], self.metrics
+        )
+        self.assertIn("alpha", self.generator.generate_text())
+        self.generator.set_data([], [], [], [], [], self.metrics)
+        self.generator.set_data(
+            [ToolUsage(tool_name="beta", timestamp=datetime.now())], [], [], [], [], self.metrics
+        )
+        self.assertIn("1. beta: 1", self.generator.generate_text())
+
+        self.generator.tool_usages[0] = ToolUsage(tool_name="gamma", timestamp=datetime.now())
+        self.assertIn("1. gamma: 1", self.generator.generate_text())
+
+    def test_generate_json_circular_arguments(self):
+        """Test self-referencing tool arguments raise json's ValueError."""
+        arguments = {"path": "a.py"}
+        arguments["self"] = arguments
+        usage = ToolUsage(tool_name="write", timestamp=datetime.now(), arguments=arguments)
+        self.generator.set_data([usage], [], [], [], [], self.metrics)
+        with self.assertRaises(ValueError):
+            self.generator.generate_json("Test")
+    
     def test_generate_text_basic(self):
         """Test basic text generation."""
         self.generator.set_data(
@@ -671,6 +950,18 @@ class TestReportGenerator(unittest.TestCase):
         
         self.assertIn("Tool Calls:", report)
         self.assertIn("Files Created:", report)
+    
+    def test_tool_counts_refresh_when_usages_grow(self):
+        """Test tool counts include usages appended after set_data."""
+        self.generator.set_data(
+            self.tool_usages, self.file_mods, self.errors,
+            self.decisions, self.milestones, self.metrics
+        )
+        self.assertNotIn("- `todo_write`: 1", self.generator.generate_markdown())
+        self.tool_usages.append(
+            ToolUsage(tool_name="todo_write", timestamp=datetime.now(), category="planning")
+        )
+        self.assertIn("- `todo_write`: 1", self.generator.generate_markdown())
 
 
 # ============================================================================
@@ -705,7 +996,149 @@ class TestSessionDocGen(unittest.TestCase):
             self.assertGreater(len(self.generator.tool_usages), 0)
         finally:
             os.unlink(temp_path)
-    
+
+    def test_load_log_file_matches_content_non_ascii_crlf(self):
+        """Test a non-ASCII CRLF log parses the same from a file and a string."""
+        content = (
+            '<tool name="café">x</tool>\r\n'
+            'Traceback (most recent call last):\r\n'
+            '  File "a.py"\r\n'
+            '\r\n'
+            'Error: disk full\r\n'
+            'We decided to use café caching.\r\n'
+        )
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.log', delete=False) as f:
+            f.write(content.encode('utf-8'))
+            temp_path = f.name
+
+        try:
+            self.generator.load_log_file(temp_path)
+            from_content = SessionDocGen()
+            from_content.load_content(content)
+
+            for gen in (self.generator, from_content):
+                self.assertEqual([t.tool_name for t in gen.tool_usages], ["café"])
+                messages = [e.error_message for e in gen.errors]
+                self.assertIn('Traceback (most recent call last):\n  File "a.py"', messages)
+                self.assertIn("Error: disk full", messages)
+                self.assertFalse(any('\r' in m for m in messages))
+            self.assertEqual(
+                [e.error_message for e in self.generator.errors],
+                [e.error_message for e in from_content.errors]
+            )
+            self.assertEqual(
+                [d.description for d in self.generator.decisions],
+                [d.description for d in from_content.decisions]
+            )
+        finally:
+            os.unlink(temp_path)
+
+    def test_load_log_file_non_ascii_peak_memory(self):
+        """Test a mostly-ASCII log with one non-ASCII character stays near its own size in memory."""
+        content = "plain filler text for the session log\n" * 25000 + "We decided to use café caching.\n"
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.log', delete=False) as f:
+            f.write(content.encode('utf-8'))
+            temp_path = f.name
+
+        try:
+            tracemalloc.start()
+            try:
+                self.generator.load_log_file(temp_path)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            # Lowercasing the decoded text whole peaked at over 10x its size
+            self.assertLess(peak, 4 * len(content))
+            self.assertEqual([d.description for d in self.generator.decisions],
+                             ["We decided to use café caching"])
+        finally:
+            os.unlink(temp_path)
+
+    def test_load_log_files_parallel_matches_sequential(self):
+        """Test parallel loading merges results and ids in path order."""
+        paths = []
+        for i in range(3):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
+                f.write(
+                    f'<invoke name="write"><parameter name="path">f{i}.py</parameter></invoke>\n'
+                    f'Error: ModuleNotFoundError: No module named mod{i}\n'
+                    f'I decided to use approach {i} for the cache.\n'
+                )
+                paths.append(f.name)
+
+        try:
+            sequential = SessionDocGen()
+            for path in paths:
+                sequential.load_log_file(path)
+            with patch('sessiondocgen._available_cpus', return_value=3):
+                self.generator.load_log_files(paths, workers=3)
+
+            self.assertGreater(len(sequential.errors), 0)
+            self.assertGreater(len(sequential.decisions), 0)
+            self.assertEqual(
+                [t.tool_name for t in self.generator.tool_usages],
+                [t.tool_name for t in sequential.tool_usages]
+            )
+            self.assertEqual(
+                [(e.error_id, e.error_message) for e in self.generator.errors],
+                [(e.error_id, e.error_message) for e in sequential.errors]
+            )
+            self.assertEqual(
+                [(d.decision_id, d.description) for d in self.generator.decisions],
+                [(d.decision_id, d.description) for d in sequential.decisions]
+            )
+            self.assertEqual(
+                [m.file_path for m in self.generator.file_modifications],
+                [m.file_path for m in sequential.file_modifications]
+            )
+            self.assertEqual(self.generator.add_error_solution("x", "runtime", "y"),
+                             sequential.add_error_solution("x", "runtime", "y"))
+        finally:
+            for path in paths:
+                os.unlink(path)
+
+    def test_load_log_files_default_loads_sequentially(self):
+        """Test load_log_files only starts a process pool when workers are requested."""
+        paths = []
+        for i in range(2):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
+                f.write('<invoke name="grep"></invoke>\n' * 50000)
+                paths.append(f.name)
+
+        try:
+            with patch('sessiondocgen._available_cpus', return_value=3), \
+                    patch('sessiondocgen.ProcessPoolExecutor',
+                          side_effect=AssertionError("pool used")):
+                self.generator.load_log_files(paths)
+            self.assertEqual(len(self.generator.tool_usages), 100000)
+        finally:
+            for path in paths:
+                os.unlink(path)
+
+    def test_load_log_files_single_cpu_loads_sequentially(self):
+        """Test load_log_files skips the process pool with one usable CPU."""
+        paths = []
+        for i in range(2):
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
+                f.write(f'Error: ModuleNotFoundError: No module named mod{i}\n')
+                paths.append(f.name)
+
+        try:
+            sequential = SessionDocGen()
+            for path in paths:
+                sequential.load_log_file(path)
+            with patch('sessiondocgen._available_cpus', return_value=1), \
+                    patch('sessiondocgen.ProcessPoolExecutor',
+                          side_effect=AssertionError("pool used")):
+                self.generator.load_log_files(paths, workers=3)
+            self.assertEqual(
+                [(e.error_id, e.error_message) for e in self.generator.errors],
+                [(e.error_id, e.error_message) for e in sequential.errors]
+            )
+        finally:
+            for path in paths:
+                os.unlink(path)
+
     def test_add_milestone(self):
         """Test adding milestone."""
         ms_id = self.generator.add_milestone("Test Complete", "All tests pass", "major")
@@ -775,6 +1208,103 @@ class TestSessionDocGen(unittest.TestCase):
             if os.path.exists(temp_path):
                 os.unlink(temp_path)
     
+    def test_save_report_json(self):
+        """Test saving JSON report matches generated JSON."""
+        self.generator.load_content('<invoke name="read_file"></invoke>')
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            temp_path = f.name
+        
+        try:
+            self.generator.save_report(temp_path, "json", "Test")
+            
+            with open(temp_path, 'r') as f:
+                saved = json.load(f)
+            expected = json.loads(self.generator.generate_report("json", "Test"))
+            saved.pop("generated_at")
+            expected.pop("generated_at")
+            self.assertEqual(saved, expected)
+            self.assertEqual(len(saved["tool_usages"]), 1)
+        finally:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+
+    def test_save_report_failure_keeps_milestone_sidecar(self):
+        """Test a failed save leaves the old report's sidecar in place."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = os.path.join(temp_dir, "report.json")
+            sidecar_path = report_path + ".milestones.jsonl"
+            with open(report_path, 'w') as f:
+                f.write('{"milestones": []}')
+            with open(sidecar_path, 'w') as f:
+                f.write('{"milestone_id": "MS_0001", "title": "Start"}\n')
+
+            with self.assertRaises(ValueError):
+                self.generator.save_report(report_path, "xml")
+            self.assertTrue(os.path.exists(sidecar_path))
+
+            self.generator.save_report(report_path, "json")
+            self.assertFalse(os.path.exists(sidecar_path))
+
+    @unittest.skipIf(os.name != "posix" or os.geteuid() == 0, "needs an unprivileged POSIX user")
+    def test_save_report_read_only_directory(self):
+        """Test a writable report can be saved inside a read-only directory."""
+        self.generator.load_content('<invoke name="read_file"></invoke>')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = os.path.join(temp_dir, "report.json")
+            with open(report_path, 'w') as f:
+                f.write('{}')
+            os.chmod(temp_dir, 0o555)
+            try:
+                self.generator.save_report(report_path, "json", "Test")
+            finally:
+                os.chmod(temp_dir, 0o755)
+
+            with open(report_path, 'r') as f:
+                self.assertEqual(json.load(f)["session_name"], "Test")
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "needs named pipes")
+    def test_save_report_fifo_target(self):
+        """Test saving to a FIFO writes through it instead of replacing it."""
+        self.generator.load_content('<invoke name="read_file"></invoke>')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fifo_path = os.path.join(temp_dir, "report.pipe")
+            os.mkfifo(fifo_path)
+
+            for format in ("json", "markdown"):
+                received = []
+
+                def read_report():
+                    with open(fifo_path, 'r') as f:
+                        received.append(f.read())
+
+                reader = threading.Thread(target=read_report)
+                reader.start()
+                try:
+                    self.generator.save_report(fifo_path, format, "Test")
+                finally:
+                    reader.join()
+
+                self.assertTrue(stat.S_ISFIFO(os.stat(fifo_path).st_mode))
+                self.assertIn("read_file", received[0])
+            self.assertEqual(os.listdir(temp_dir), ["report.pipe"])
+
+    def test_save_report_keeps_hard_links(self):
+        """Test saving over a hard-linked report updates every name."""
+        self.generator.load_content('<invoke name="read_file"></invoke>')
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = os.path.join(temp_dir, "report.json")
+            link_path = os.path.join(temp_dir, "latest.json")
+            with open(report_path, 'w') as f:
+                f.write('{}')
+            os.link(report_path, link_path)
+
+            self.generator.save_report(report_path, "json", "Test")
+
+            with open(link_path, 'r') as f:
+                self.assertEqual(json.load(f)["session_name"], "Test")
+            self.assertTrue(os.path.samefile(report_path, link_path))
+
     def test_get_summary(self):
         """Test getting quick summary."""
         self.generator.load_content('<invoke name="write"></invoke>')
@@ -808,6 +1338,11 @@ class TestSessionDocGen(unittest.TestCase):
 class TestCLI(unittest.TestCase):
     """Test CLI functionality."""
     
+    @classmethod
+    def setUpClass(cls):
+        # parse_args never mutates the parser, so the tests can share one
+        cls.parser = create_parser()
+    
     def test_create_parser(self):
         """Test parser creation."""
         parser = create_parser()
@@ -815,42 +1350,44 @@ class TestCLI(unittest.TestCase):
     
     def test_parse_command(self):
         """Test parse command parsing."""
-        parser = create_parser()
-        args = parser.parse_args(["parse", "test.log", "-o", "out.md"])
+        args = self.parser.parse_args(["parse", "test.log", "-o", "out.md"])
         self.assertEqual(args.command, "parse")
         self.assertEqual(args.logs, ["test.log"])
         self.assertEqual(args.output, "out.md")
     
     def test_parse_command_format(self):
         """Test parse command with format option."""
-        parser = create_parser()
-        args = parser.parse_args(["parse", "test.log", "-f", "json"])
+        args = self.parser.parse_args(["parse", "test.log", "-f", "json"])
         self.assertEqual(args.format, "json")
     
     def test_summary_command(self):
         """Test summary command parsing."""
-        parser = create_parser()
-        args = parser.parse_args(["summary", "log1.txt", "log2.txt"])
+        args = self.parser.parse_args(["summary", "log1.txt", "log2.txt"])
         self.assertEqual(args.command, "summary")
         self.assertEqual(len(args.logs), 2)
     
     def test_milestone_command(self):
         """Test milestone command parsing."""
-        parser = create_parser()
-        args = parser.parse_args(["milestone", "MVP Done", "-r", "report.json"])
+        args = self.parser.parse_args(["milestone", "MVP Done", "-r", "report.json"])
         self.assertEqual(args.command, "milestone")
         self.assertEqual(args.title, "MVP Done")
         self.assertEqual(args.report, "report.json")
     
+    def test_workers_option(self):
+        """Test -j/--workers defaults to a single process."""
+        args = self.parser.parse_args(["summary", "log1.txt"])
+        self.assertEqual(args.workers, 1)
+        args = self.parser.parse_args(["stats", "log1.txt", "-j", "4"])
+        self.assertEqual(args.workers, 4)
+    
     def test_stats_command(self):
         """Test stats command parsing."""
-        parser = create_parser()
-        args = parser.parse_args(["stats", "session.log"])
+        args = self.parser.parse_args(["stats", "session.log"])
         self.assertEqual(args.command, "stats")
     
     def test_main_no_command(self):
         """Test main with no command shows help."""
-        with patch('sys.argv', ['sessiondocgen']):
+        with patch('sys.argv', ['sessiondocgen']), redirect_stdout(StringIO()):
             result = main()
             self.assertEqual(result, 0)
     
@@ -861,12 +1398,55 @@ class TestCLI(unittest.TestCase):
             temp_path = f.name
         
         try:
+            stdout = StringIO()
             with patch('sys.argv', ['sessiondocgen', 'parse', temp_path]):
-                with patch('sys.stdout', new_callable=StringIO) as mock_stdout:
+                with redirect_stdout(stdout):
                     result = main()
                     self.assertEqual(result, 0)
+            self.assertIn("`read_file`: 1", stdout.getvalue())
+        finally:
+            os.unlink(temp_path)
+    
+    def test_main_stats_command(self):
+        """Test main with stats command prints category and top-tool breakdowns."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
+            f.write('<invoke name="grep"></invoke>\n' * 3 + '<invoke name="read_file"></invoke>\n')
+            temp_path = f.name
+
+        try:
+            stdout = StringIO()
+            with patch('sys.argv', ['sessiondocgen', 'stats', temp_path]):
+                with redirect_stdout(stdout):
+                    self.assertEqual(main(), 0)
+            lines = stdout.getvalue().splitlines()
+            self.assertIn("  search          3 ( 75.0%) " + "#" * 15, lines)
+            self.assertIn("  read            1 ( 25.0%) " + "#" * 5, lines)
+            self.assertIn("  grep" + " " * 26 + "    3 ( 75.0%)", lines)
+            self.assertIn("  read_file" + " " * 21 + "    1 ( 25.0%)", lines)
+            self.assertIn("Total Tool Calls: 4", lines)
+            self.assertLess(lines.index("  search          3 ( 75.0%) " + "#" * 15),
+                            lines.index("  read            1 ( 25.0%) " + "#" * 5))
         finally:
             os.unlink(temp_path)
+
+    def test_main_reports_log_removed_while_loading(self):
+        """Test a log that disappears after the existence check fails cleanly."""
+        missing_path = os.path.join(tempfile.gettempdir(), "sessiondocgen_gone.log")
+        stderr = StringIO()
+        with patch('sys.argv', ['sessiondocgen', 'summary', missing_path]):
+            with patch('sessiondocgen.os.path.exists', return_value=True), patch('sys.stderr', stderr):
+                self.assertEqual(main(), 1)
+        self.assertIn("Log file not found", stderr.getvalue())
+
+    def test_main_parse_stdin(self):
+        """Test main with parse command reading the log from stdin."""
+        stdin = StringIO('<invoke name="read_file"></invoke>')
+        stdout = StringIO()
+        with patch('sys.argv', ['sessiondocgen', 'parse', '-']), patch('sys.stdin', stdin):
+            with redirect_stdout(stdout):
+                result = main()
+                self.assertEqual(result, 0)
+        self.assertIn("`read_file`: 1", stdout.getvalue())
     
     def test_main_summary_command(self):
         """Test main with summary command."""
@@ -875,12 +1455,121 @@ class TestCLI(unittest.TestCase):
             temp_path = f.name
         
         try:
+            stdout = StringIO()
             with patch('sys.argv', ['sessiondocgen', 'summary', temp_path]):
-                with patch('sys.stdout', new_callable=StringIO):
+                with redirect_stdout(stdout):
                     result = main()
                     self.assertEqual(result, 0)
+            self.assertIn("Tool Calls:     1", stdout.getvalue())
+        finally:
+            os.unlink(temp_path)
+
+    @unittest.skipUnless(os.path.exists("/dev/stdout"), "needs /dev/stdout")
+    def test_main_parse_output_dev_stdout(self):
+        """Test parse -o /dev/stdout writes the report to a piped stdout."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.log', delete=False) as f:
+            f.write('<invoke name="grep"></invoke>')
+            temp_path = f.name
+
+        try:
+            script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sessiondocgen.py")
+            for format in ("json", "markdown"):
+                result = subprocess.run(
+                    [sys.executable, script, 'parse', temp_path, '-f', format, '-o', '/dev/stdout'],
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+                )
+                self.assertEqual(result.returncode, 0, result.stderr)
+                self.assertIn("grep", result.stdout)
+        finally:
+            os.unlink(temp_path)
+    
+    def test_main_summary_stdin(self):
+        """Test main with summary command reading the log from stdin."""
+        stdin = StringIO('<invoke name="write"></invoke>')
+        stdout = StringIO()
+        with patch('sys.argv', ['sessiondocgen', 'summary', '-']), patch('sys.stdin', stdin):
+            with redirect_stdout(stdout):
+                result = main()
+                self.assertEqual(result, 0)
+        self.assertIn("Tool Calls:     1", stdout.getvalue())
+    
+    def test_main_summary_stdin_invalid_utf8(self):
+        """Test invalid UTF-8 on a strict stdin loads as the same bytes do from a file."""
+        raw = b'<invoke name="grep"></invoke>\n\xff\xfeError: disk full\n'
+        with tempfile.NamedTemporaryFile(mode='wb', suffix='.log', delete=False) as f:
+            f.write(raw)
+            temp_path = f.name
+        
+        try:
+            outputs = []
+            for log_arg in ('-', temp_path):
+                stdin = TextIOWrapper(BytesIO(raw), encoding='utf-8', errors='strict')
+                stdout = StringIO()
+                with patch('sys.argv', ['sessiondocgen', 'summary', log_arg]), patch('sys.stdin', stdin):
+                    with redirect_stdout(stdout):
+                        self.assertEqual(main(), 0)
+                outputs.append(stdout.getvalue())
         finally:
             os.unlink(temp_path)
+        self.assertIn("Tool Calls:     1", outputs[0])
+        self.assertEqual(outputs[0], outputs[1])
+    
+    def test_main_milestone_sidecar(self):
+        """Test milestone --sidecar appends without rewriting the report."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = os.path.join(temp_dir, "report.json")
+            with open(report_path, 'w') as f:
+                json.dump({"milestones": [{"milestone_id": "MS_0001", "title": "Start"}]}, f)
+            
+            for argv in (['milestone', 'Tests Pass', '-r', report_path, '--sidecar'],
+                         ['milestone', 'Shipped', '-r', report_path]):
+                with patch('sys.argv', ['sessiondocgen'] + argv):
+                    with redirect_stdout(StringIO()):
+                        self.assertEqual(main(), 0)
+            
+            with open(report_path, 'r') as f:
+                self.assertEqual(len(json.load(f)["milestones"]), 1)
+            
+            milestones = load_json_report(report_path)["milestones"]
+            self.assertEqual([m["milestone_id"] for m in milestones], ["MS_0001", "MS_0002", "MS_0003"])
+            self.assertEqual(milestones[2]["title"], "Shipped")
+
+    def test_main_parse_discards_stale_sidecar(self):
+        """Test re-parsing a report drops milestones appended to the old one."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = os.path.join(temp_dir, "session.log")
+            report_path = os.path.join(temp_dir, "report.json")
+            with open(log_path, 'w') as f:
+                f.write('<invoke name="grep"></invoke>')
+
+            for argv in (['parse', log_path, '-f', 'json', '-o', report_path],
+                         ['milestone', 'Old', '-r', report_path, '--sidecar'],
+                         ['parse', log_path, '-f', 'json', '-o', report_path],
+                         ['milestone', 'New', '-r', report_path]):
+                with patch('sys.argv', ['sessiondocgen'] + argv):
+                    with redirect_stdout(StringIO()):
+                        self.assertEqual(main(), 0)
+
+            milestones = load_json_report(report_path)["milestones"]
+            self.assertEqual([(m["milestone_id"], m["title"]) for m in milestones],
+                             [("MS_0001", "New")])
+
+    def test_main_milestone_sidecar_truncated_line(self):
+        """Test a cut-short sidecar line is skipped rather than crashing."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            report_path = os.path.join(temp_dir, "report.json")
+            with open(report_path, 'w') as f:
+                json.dump({"milestones": []}, f)
+            with open(report_path + ".milestones.jsonl", 'w') as f:
+                f.write('{"milestone_id": "MS_0001", "title": "Start"}\n{"milestone_id": "MS_00')
+
+            with patch('sys.argv', ['sessiondocgen', 'milestone', 'Next', '-r', report_path]):
+                with redirect_stdout(StringIO()):
+                    self.assertEqual(main(), 0)
+
+            milestones = load_json_report(report_path)["milestones"]
+            self.assertEqual([(m["milestone_id"], m["title"]) for m in milestones],
+                             [("MS_0001", "Start"), ("MS_0002", "Next")])
 
 
 # ============================================================================
@@ -1028,6 +1717,29 @@ class TestIntegration(unittest.TestCase):
 # RUN TESTS
 # ============================================================================
 
+TEST_CASES = (
+    TestToolUsage,
+    TestFileModification,
+    TestDecision,
+    TestErrorSolution,
+    TestMilestone,
+    TestSessionMetrics,
+    TestToolUsageParser,
+    TestFileModificationParser,
+    TestDecisionParser,
+    TestParseSession,
+    TestMetricsCalculator,
+    TestReportGenerator,
+    TestSessionDocGen,
+    TestCLI,
+    TestEdgeCases,
+    TestIntegration,
+)
+
+
 if __name__ == "__main__":
-    # Run with verbose output
-    unittest.main(verbosity=2)
+    # Build the suite directly instead of scanning the module for tests
+    loader = unittest.defaultTestLoader
+    suite = unittest.TestSuite(loader.loadTestsFromTestCase(case) for case in TEST_CASES)
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())